@@ -11,8 +11,12 @@ License: MIT
 import hashlib
 import random
 import string
-from dataclasses import dataclass, asdict
-from typing import Dict, Any, List, Optional
+import sys
+from dataclasses import dataclass
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+# Slotted dataclasses (no per-instance __dict__) require Python 3.10+
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 # Browser configurations
 BROWSERS = {
@@ -72,6 +76,27 @@ OPERATING_SYSTEMS = {
     },
 }
 
+# Browser and OS option pools, flattened to tuples for random.choice()
+_BROWSER_KEYS = tuple(BROWSERS)
+_BROWSER_VERSIONS = {key: tuple(config["versions"]) for key, config in BROWSERS.items()}
+_OS_VERSIONS = {key: tuple(config["versions"]) for key, config in OPERATING_SYSTEMS.items()}
+_OS_PLATFORMS = {key: tuple(config["platforms"]) for key, config in OPERATING_SYSTEMS.items()}
+
+# Device types, the operating systems they run and the browsers each OS offers
+_DEVICE_TYPES = ("Desktop", "Laptop", "Mobile", "Tablet")
+_DESKTOP_OS = ("windows", "macos", "linux")
+_MOBILE_OS = ("android", "ios")
+_OS_FOR_DEVICE = {
+    "Desktop": _DESKTOP_OS,
+    "Laptop": _DESKTOP_OS,
+    "Mobile": _MOBILE_OS,
+    "Tablet": _MOBILE_OS,
+}
+_BROWSERS_FOR_OS = {
+    "ios": ("safari",),
+    "android": ("chrome", "firefox"),
+}
+
 # Screen resolutions
 SCREEN_RESOLUTIONS = [
     {"width": 1920, "height": 1080, "device": "Desktop"},
@@ -89,6 +114,14 @@ SCREEN_RESOLUTIONS = [
     {"width": 768, "height": 1024, "device": "Tablet"},
 ]
 
+# Screen resolutions grouped by device type (laptops may also use desktop screens)
+_resolution_buckets: Dict[str, List[Dict[str, Any]]] = {}
+for _resolution in SCREEN_RESOLUTIONS:
+    _resolution_buckets.setdefault(_resolution["device"], []).append(_resolution)
+_resolution_buckets["Laptop"] += _resolution_buckets["Desktop"]
+RESOLUTIONS_BY_DEVICE = {device: tuple(res) for device, res in _resolution_buckets.items()}
+del _resolution, _resolution_buckets
+
 # Languages
 LANGUAGES = [
     "en-US", "en-GB", "en-AU", "en-CA",
@@ -127,8 +160,45 @@ WEBGL_CONFIGS = [
     {"vendor": "Qualcomm", "renderer": "Adreno (TM) 650"},
 ]
 
+# Device-independent display, network and privacy settings
+COLOR_DEPTHS = [24, 32]
+PIXEL_RATIOS = [1.0, 1.25, 1.5, 2.0, 3.0]
+CONNECTION_TYPES = ["wifi", "ethernet", "4g", "5g"]
+DO_NOT_TRACK_VALUES = [None, "1", "0"]
+
+# User agent builders per browser, filled with the OS part and browser version
+_BROWSER_UA = {
+    "chrome": lambda os_ua, version: f"Mozilla/5.0 ({os_ua}) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{version} Safari/537.36",
+    "firefox": lambda os_ua, version: f"Mozilla/5.0 ({os_ua}; rv:{version}) Gecko/20100101 Firefox/{version}",
+    "safari": lambda os_ua, version: f"Mozilla/5.0 ({os_ua}) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/{version} Safari/605.1.15",
+    "edge": lambda os_ua, version: f"Mozilla/5.0 ({os_ua}) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{version} Safari/537.36 Edg/{version}",
+}
+
+# Windows releases mapped to the NT version reported in user agents
+_WINDOWS_NT_VERSIONS = {"10": "10.0", "11": "11.0"}
+
+# OS part of the user agent for every (os, os_version) pair
+_OS_UA = {}
+for _os, _config in OPERATING_SYSTEMS.items():
+    for _version in _config["versions"]:
+        if _os == "windows":
+            _ua_version = _WINDOWS_NT_VERSIONS.get(_version, _version)
+        elif _os in ("macos", "ios"):
+            _ua_version = _version.replace(".", "_")
+        else:
+            _ua_version = _version
+        _OS_UA[(_os, _version)] = _config["user_agent_part"].format(version=_ua_version)
+del _os, _config, _version, _ua_version
 
-@dataclass
+# Private IPv4 ranges as (first octet, second octet mask, second octet base)
+_PRIVATE_IP_RANGES = (
+    (10, 0xFF, 0),      # 10.0.0.0/8
+    (172, 0x0F, 16),    # 172.16.0.0/12
+    (192, 0x00, 168),   # 192.168.0.0/16
+)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Fingerprint:
     """Represents a browser/device fingerprint."""
     # Browser info
@@ -175,22 +245,56 @@ class Fingerprint:
     # Audio fingerprint
     audio_hash: str
     
-    # Misc
-    do_not_track: Optional[str]
-    cookies_enabled: bool
-    local_storage: bool
-    session_storage: bool
-    indexed_db: bool
-    
     # MAC address (for local network simulation)
     mac_address: str
     
-    # Unique fingerprint hash
-    fingerprint_hash: str
+    # Unique fingerprint hash (filled in once the other fields are set)
+    fingerprint_hash: str = ""
+    
+    # Misc (storage APIs are always reported as enabled)
+    do_not_track: Optional[str] = None
+    cookies_enabled: bool = True
+    local_storage: bool = True
+    session_storage: bool = True
+    indexed_db: bool = True
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        return {
+            "user_agent": self.user_agent,
+            "browser_name": self.browser_name,
+            "browser_version": self.browser_version,
+            "browser_engine": self.browser_engine,
+            "platform": self.platform,
+            "os_name": self.os_name,
+            "os_version": self.os_version,
+            "device_type": self.device_type,
+            "screen_width": self.screen_width,
+            "screen_height": self.screen_height,
+            "screen_resolution": self.screen_resolution,
+            "color_depth": self.color_depth,
+            "pixel_ratio": self.pixel_ratio,
+            "language": self.language,
+            "languages": list(self.languages),
+            "timezone": self.timezone,
+            "timezone_offset": self.timezone_offset,
+            "ip_address": self.ip_address,
+            "connection_type": self.connection_type,
+            "cpu_cores": self.cpu_cores,
+            "device_memory": self.device_memory,
+            "max_touch_points": self.max_touch_points,
+            "webgl_vendor": self.webgl_vendor,
+            "webgl_renderer": self.webgl_renderer,
+            "canvas_hash": self.canvas_hash,
+            "audio_hash": self.audio_hash,
+            "do_not_track": self.do_not_track,
+            "cookies_enabled": self.cookies_enabled,
+            "local_storage": self.local_storage,
+            "session_storage": self.session_storage,
+            "indexed_db": self.indexed_db,
+            "mac_address": self.mac_address,
+            "fingerprint_hash": self.fingerprint_hash,
+        }
 
 
 class FingerprintGenerator:
@@ -210,6 +314,9 @@ class FingerprintGenerator:
         """
         if seed is not None:
             random.seed(seed)
+        
+        # Pre-drawn canvas/audio hash tokens, consumed by generate()
+        self._hash_pool: List[str] = []
     
     def generate(
         self,
@@ -228,34 +335,38 @@ class FingerprintGenerator:
         Returns:
             Generated Fingerprint object
         """
+        return self._build(next(self._draw_shared(1)), device_type, browser, os)
+    
+    def _build(
+        self,
+        shared: Tuple[Any, ...],
+        device_type: Optional[str] = None,
+        browser: Optional[str] = None,
+        os: Optional[str] = None
+    ) -> Fingerprint:
+        """Build a fingerprint around attributes drawn by _draw_shared()."""
+        (language, tz, webgl, color_depth, pixel_ratio, connection_type,
+         do_not_track, ip_address) = shared
+        choice = random.choice  # local alias avoids repeated attribute lookups
+        
         # Select device type
         if device_type is None:
-            device_type = random.choice(["Desktop", "Laptop", "Mobile", "Tablet"])
+            device_type = choice(_DEVICE_TYPES)
         
         # Select OS based on device type
         if os is None:
-            if device_type in ["Desktop", "Laptop"]:
-                os = random.choice(["windows", "macos", "linux"])
-            elif device_type == "Mobile":
-                os = random.choice(["android", "ios"])
-            else:  # Tablet
-                os = random.choice(["android", "ios"])
+            os = choice(_OS_FOR_DEVICE.get(device_type, _MOBILE_OS))
         
         os_config = OPERATING_SYSTEMS[os]
-        os_version = random.choice(os_config["versions"])
-        platform = random.choice(os_config["platforms"])
+        os_version = choice(_OS_VERSIONS[os])
+        platform = choice(_OS_PLATFORMS[os])
         
         # Select browser
         if browser is None:
-            if os == "ios":
-                browser = "safari"
-            elif os == "android":
-                browser = random.choice(["chrome", "firefox"])
-            else:
-                browser = random.choice(list(BROWSERS.keys()))
+            browser = choice(_BROWSERS_FOR_OS.get(os, _BROWSER_KEYS))
         
         browser_config = BROWSERS[browser]
-        browser_version = random.choice(browser_config["versions"])
+        browser_version = choice(_BROWSER_VERSIONS[browser])
         
         # Generate user agent
         user_agent = self._generate_user_agent(
@@ -263,43 +374,28 @@ class FingerprintGenerator:
         )
         
         # Select screen resolution
-        matching_resolutions = [
-            r for r in SCREEN_RESOLUTIONS 
-            if r["device"] == device_type or device_type == "Laptop" and r["device"] == "Desktop"
-        ]
-        if not matching_resolutions:
-            matching_resolutions = SCREEN_RESOLUTIONS
+        matching_resolutions = RESOLUTIONS_BY_DEVICE.get(device_type, SCREEN_RESOLUTIONS)
+        resolution = choice(matching_resolutions)
         
-        resolution = random.choice(matching_resolutions)
-        
-        # Select language and timezone
-        language = random.choice(LANGUAGES)
+        # Derive accepted languages
         languages = [language]
         if "-" in language:
             base_lang = language.split("-")[0]
             languages.append(base_lang)
         
-        tz = random.choice(TIMEZONES)
-        
-        # Generate IP address (private range for safety)
-        ip_address = self._generate_private_ip()
-        
         # Hardware specs based on device type
         if device_type in ["Desktop", "Laptop"]:
-            cpu_cores = random.choice([4, 6, 8, 12, 16])
-            device_memory = random.choice([8, 16, 32, 64])
+            cpu_cores = choice([4, 6, 8, 12, 16])
+            device_memory = choice([8, 16, 32, 64])
             max_touch_points = 0
         else:
-            cpu_cores = random.choice([4, 6, 8])
-            device_memory = random.choice([4, 6, 8, 12])
-            max_touch_points = random.choice([5, 10])
-        
-        # WebGL
-        webgl = random.choice(WEBGL_CONFIGS)
+            cpu_cores = choice([4, 6, 8])
+            device_memory = choice([4, 6, 8, 12])
+            max_touch_points = choice([5, 10])
         
         # Generate hashes
-        canvas_hash = self._generate_hash("canvas")
-        audio_hash = self._generate_hash("audio")
+        canvas_hash = self._next_hash()
+        audio_hash = self._next_hash()
         
         # MAC address
         mac_address = self._generate_mac_address()
@@ -317,14 +413,14 @@ class FingerprintGenerator:
             screen_width=resolution["width"],
             screen_height=resolution["height"],
             screen_resolution=f"{resolution['width']}x{resolution['height']}",
-            color_depth=random.choice([24, 32]),
-            pixel_ratio=random.choice([1.0, 1.25, 1.5, 2.0, 3.0]),
+            color_depth=color_depth,
+            pixel_ratio=pixel_ratio,
             language=language,
             languages=languages,
             timezone=tz["name"],
             timezone_offset=tz["offset"] * 60,
             ip_address=ip_address,
-            connection_type=random.choice(["wifi", "ethernet", "4g", "5g"]),
+            connection_type=connection_type,
             cpu_cores=cpu_cores,
             device_memory=device_memory,
             max_touch_points=max_touch_points,
@@ -332,13 +428,8 @@ class FingerprintGenerator:
             webgl_renderer=webgl["renderer"],
             canvas_hash=canvas_hash,
             audio_hash=audio_hash,
-            do_not_track=random.choice([None, "1", "0"]),
-            cookies_enabled=True,
-            local_storage=True,
-            session_storage=True,
-            indexed_db=True,
             mac_address=mac_address,
-            fingerprint_hash=""
+            do_not_track=do_not_track
         )
         
         # Generate unique fingerprint hash
@@ -357,7 +448,29 @@ class FingerprintGenerator:
         Returns:
             List of Fingerprint objects
         """
-        return [self.generate(**kwargs) for _ in range(count)]
+        # Draw the canvas and audio hashes for the whole batch at once
+        if count > 0:
+            self._hash_pool.extend(self._alloc_hashes(2 * count))
+        return [self._build(shared, **kwargs) for shared in self._draw_shared(count)]
+    
+    def _draw_shared(self, count: int) -> Iterator[Tuple[Any, ...]]:
+        """
+        Draw the device-independent attributes of count fingerprints.
+        
+        Each attribute is drawn for the whole batch with one
+        random.choices() call instead of one random.choice() per
+        fingerprint.
+        """
+        return zip(
+            random.choices(LANGUAGES, k=count),
+            random.choices(TIMEZONES, k=count),
+            random.choices(WEBGL_CONFIGS, k=count),
+            random.choices(COLOR_DEPTHS, k=count),
+            random.choices(PIXEL_RATIOS, k=count),
+            random.choices(CONNECTION_TYPES, k=count),
+            random.choices(DO_NOT_TRACK_VALUES, k=count),
+            self._generate_private_ips(count),
+        )
     
     def _generate_user_agent(
         self,
@@ -368,58 +481,43 @@ class FingerprintGenerator:
         device_type: str
     ) -> str:
         """Generate a realistic user agent string."""
-        os_config = OPERATING_SYSTEMS[os]
-        
-        # Format OS version for user agent
-        if os == "windows":
-            os_ua = f"Windows NT {'10.0' if os_version == '10' else '11.0'}"
-        elif os == "macos":
-            os_ua = f"Macintosh; Intel Mac OS X {os_version.replace('.', '_')}"
-        elif os == "linux":
-            os_ua = f"X11; Linux {os_version}"
-        elif os == "android":
-            os_ua = f"Linux; Android {os_version}"
-        elif os == "ios":
-            os_ua = f"iPhone; CPU iPhone OS {os_version.replace('.', '_')} like Mac OS X"
-        else:
-            os_ua = os_config["user_agent_part"].format(version=os_version)
-        
-        # Build user agent based on browser
-        if browser == "chrome":
-            return f"Mozilla/5.0 ({os_ua}) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{browser_version} Safari/537.36"
-        elif browser == "firefox":
-            return f"Mozilla/5.0 ({os_ua}; rv:{browser_version}) Gecko/20100101 Firefox/{browser_version}"
-        elif browser == "safari":
-            return f"Mozilla/5.0 ({os_ua}) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/{browser_version} Safari/605.1.15"
-        elif browser == "edge":
-            return f"Mozilla/5.0 ({os_ua}) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{browser_version} Safari/537.36 Edg/{browser_version}"
-        
-        return f"Mozilla/5.0 ({os_ua})"
+        os_ua = _OS_UA[(os, os_version)]
+        build = _BROWSER_UA.get(browser)
+        if build is None:
+            return f"Mozilla/5.0 ({os_ua})"
+        return build(os_ua, browser_version)
     
-    def _generate_private_ip(self) -> str:
-        """Generate a private IP address."""
-        ranges = [
-            (10, 0, 0, 0, 255, 255, 255),      # 10.0.0.0/8
-            (172, 16, 0, 0, 31, 255, 255),     # 172.16.0.0/12
-            (192, 168, 0, 0, 0, 255, 255),     # 192.168.0.0/16
-        ]
+    def _generate_private_ips(self, count: int) -> List[str]:
+        """Generate count private IP addresses from a single random draw."""
+        if count <= 0:
+            return []
         
-        r = random.choice(ranges)
-        return f"{r[0]}.{random.randint(r[1], r[4])}.{random.randint(r[2], r[5])}.{random.randint(r[3], r[6])}"
+        ranges = random.choices(_PRIVATE_IP_RANGES, k=count)
+        octets = random.getrandbits(24 * count).to_bytes(3 * count, "big")
+        return [
+            f"{first}.{(octets[i] & mask) | base}.{octets[i + 1]}.{octets[i + 2]}"
+            for i, (first, mask, base) in zip(range(0, 3 * count, 3), ranges)
+        ]
     
     def _generate_mac_address(self) -> str:
         """Generate a random MAC address."""
-        return ":".join([f"{random.randint(0, 255):02x}" for _ in range(6)])
+        return random.getrandbits(48).to_bytes(6, "big").hex(":")
+    
+    def _alloc_hashes(self, n: int) -> List[str]:
+        """Generate n random 32-character hex hashes from a single draw."""
+        raw = random.getrandbits(128 * n).to_bytes(16 * n, "big").hex()
+        return [raw[i:i + 32] for i in range(0, 32 * n, 32)]
     
-    def _generate_hash(self, prefix: str) -> str:
-        """Generate a random hash."""
-        data = f"{prefix}_{random.random()}_{random.randint(0, 1000000)}"
-        return hashlib.sha256(data.encode()).hexdigest()[:32]
+    def _next_hash(self) -> str:
+        """Take a random hash from the pre-drawn pool, refilling it if empty."""
+        if not self._hash_pool:
+            self._hash_pool = self._alloc_hashes(2)
+        return self._hash_pool.pop()
     
     def _generate_fingerprint_hash(self, fp: Fingerprint) -> str:
         """Generate a unique hash for the fingerprint."""
         data = f"{fp.user_agent}|{fp.screen_resolution}|{fp.timezone}|{fp.language}|{fp.webgl_renderer}"
-        return hashlib.sha256(data.encode()).hexdigest()
+        return hashlib.blake2b(data.encode(), digest_size=16).hexdigest()
 
 
 def generate_fingerprint() -> Dict[str, Any]:
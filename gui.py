@@ -1,40 +1,51 @@
 import tkinter as tk
-from tkinter import messagebox, font
-from identity_generator import generate_fake_identity
-from fingerprint_generator import generate_fingerprint
-import json
-import os
-
-def save_profile_to_file(profile, filename):
-    with open(filename, "w") as f:
-        json.dump(profile, f, indent=4)
-
-def generate_and_save(count):
-    os.makedirs("profiles", exist_ok=True)
-    for i in range(1, count + 1):
-        identity = generate_fake_identity()
-        fingerprint = generate_fingerprint()
-        profile = {
-            "identity": identity,
-            "fingerprint": fingerprint
-        }
-        filename = f"profiles/fake_profile_{i}.json"
-        save_profile_to_file(profile, filename)
+from tkinter import messagebox, font, ttk
+from main import save_profiles_to_files
+import threading
+
+def generate_in_background(count, state):
+    # Runs on the worker thread: only records progress, never touches Tk
+    def record_progress(done, filename):
+        state["done"] = done
+    try:
+        save_profiles_to_files(count, on_progress=record_progress)
+    except Exception as e:
+        state["error"] = e
+
+def poll_progress(worker, count, state):
+    progress.configure(value=state["done"])
+    if worker.is_alive():
+        root.after(100, poll_progress, worker, count, state)
+    else:
+        on_generate_done(count, state["error"])
+
+def on_generate_done(count, error):
+    btn.config(state="normal")
+    if error is not None:
+        messagebox.showerror("Error", f"Profile generation failed: {error}")
+    else:
+        messagebox.showinfo("Success", f"{count} profiles generated successfully!")
 
 def on_generate():
     try:
         count = int(entry.get())
-        if count <= 0:
-            messagebox.showerror("Error", "Please enter a positive integer")
-            return
-        generate_and_save(count)
-        messagebox.showinfo("Success", f"{count} profiles generated successfully!")
     except ValueError:
         messagebox.showerror("Error", "Please enter a valid integer")
+        return
+    if count <= 0:
+        messagebox.showerror("Error", "Please enter a positive integer")
+        return
+    # Generate off the Tk thread so the window stays responsive
+    btn.config(state="disabled")
+    progress.configure(maximum=count, value=0)
+    state = {"done": 0, "error": None}
+    worker = threading.Thread(target=generate_in_background, args=(count, state), daemon=True)
+    worker.start()
+    poll_progress(worker, count, state)
 
 root = tk.Tk()
 root.title("Fake Identity Generator")
-root.geometry("400x220")
+root.geometry("400x260")
 root.configure(bg="#1e1e2f")
 
 signature_font = font.Font(family="Courier New", size=10, weight="bold", slant="italic")
@@ -46,7 +57,10 @@ entry = tk.Entry(root, font=("Helvetica", 14), width=15, justify='center')
 entry.pack(pady=5)
 
 btn = tk.Button(root, text="Generate", command=on_generate, bg="#4caf50", fg="white", font=("Helvetica", 14), activebackground="#388e3c", padx=20, pady=5)
-btn.pack(pady=20)
+btn.pack(pady=(20,10))
+
+progress = ttk.Progressbar(root, orient="horizontal", length=300, mode="determinate")
+progress.pack(pady=5)
 
 signature = tk.Label(root, text="Created by oussema ghariani 🇹🇳", fg="#bbbbbb", bg="#1e1e2f", font=signature_font)
 signature.pack(side="bottom", pady=10)
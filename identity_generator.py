@@ -8,17 +8,21 @@ Author: Ghariani Oussema
 License: MIT
 """
 
+import functools
+import importlib.util
 import random
 import string
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import date, timedelta
-from typing import Optional, Dict, Any, List
+from typing import TYPE_CHECKING, Optional, Dict, Any, List
 
-try:
+from fingerprint_generator import _DATACLASS_OPTIONS
+
+# Faker loads dozens of provider modules, so it is only imported on first use
+FAKER_AVAILABLE = importlib.util.find_spec("faker") is not None
+
+if TYPE_CHECKING:
     from faker import Faker
-    FAKER_AVAILABLE = True
-except ImportError:
-    FAKER_AVAILABLE = False
 
 # Locales for international identity generation
 SUPPORTED_LOCALES = [
@@ -26,6 +30,13 @@ SUPPORTED_LOCALES = [
     "it_IT", "pt_BR", "ar_SA", "ja_JP", "zh_CN",
     "ru_RU", "nl_NL", "pl_PL", "tr_TR", "ar_TN"
 ]
+_SUPPORTED_LOCALES_SET = frozenset(SUPPORTED_LOCALES)
+
+# Email providers
+EMAIL_DOMAINS = [
+    "gmail.com", "yahoo.com", "outlook.com", "hotmail.com",
+    "protonmail.com", "icloud.com", "mail.com", "aol.com"
+]
 
 # Avatar services
 AVATAR_SERVICES = [
@@ -36,7 +47,14 @@ AVATAR_SERVICES = [
 ]
 
 
-@dataclass
+@functools.lru_cache(maxsize=32)
+def _get_faker(locale: str) -> "Faker":
+    """Return a shared Faker instance for the locale, loading its providers once."""
+    from faker import Faker
+    return Faker(locale)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Identity:
     """Represents a generated fake identity."""
     full_name: str
@@ -52,7 +70,7 @@ class Identity:
     birthdate: str
     age: int
     gender: str
-    national_id: str
+    national_id: Optional[str] = None
     passport_number: Optional[str] = None
     driver_license: Optional[str] = None
     credit_card: Optional[str] = None
@@ -67,7 +85,33 @@ class Identity:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        return {
+            "full_name": self.full_name,
+            "first_name": self.first_name,
+            "last_name": self.last_name,
+            "username": self.username,
+            "email": self.email,
+            "phone": self.phone,
+            "address": self.address,
+            "city": self.city,
+            "country": self.country,
+            "postal_code": self.postal_code,
+            "birthdate": self.birthdate,
+            "age": self.age,
+            "gender": self.gender,
+            "national_id": self.national_id,
+            "passport_number": self.passport_number,
+            "driver_license": self.driver_license,
+            "credit_card": self.credit_card,
+            "credit_card_expiry": self.credit_card_expiry,
+            "credit_card_cvv": self.credit_card_cvv,
+            "bank_account": self.bank_account,
+            "company": self.company,
+            "job_title": self.job_title,
+            "website": self.website,
+            "profile_pic_url": self.profile_pic_url,
+            "locale": self.locale,
+        }
 
 
 class IdentityGenerator:
@@ -89,10 +133,11 @@ class IdentityGenerator:
         if not FAKER_AVAILABLE:
             raise ImportError("Faker library is required. Install with: pip install faker")
         
-        self.locale = locale if locale in SUPPORTED_LOCALES else "en_US"
-        self.faker = Faker(self.locale)
+        self.locale = locale if locale in _SUPPORTED_LOCALES_SET else "en_US"
+        self.faker = _get_faker(self.locale)
         
         if seed is not None:
+            from faker import Faker
             Faker.seed(seed)
             random.seed(seed)
     
@@ -117,22 +162,73 @@ class IdentityGenerator:
         Returns:
             Generated Identity object
         """
+        return self._build(
+            date.today(), include_financial, include_professional, min_age, max_age, gender
+        )
+    
+    def generate_minimal(
+        self,
+        min_age: int = 18,
+        max_age: int = 65,
+        gender: Optional[str] = None
+    ) -> Identity:
+        """
+        Generate an identity with personal and contact details only.
+        
+        Government IDs, financial and professional info and the profile
+        picture are left empty, skipping the costliest Faker providers.
+        
+        Args:
+            min_age: Minimum age for the identity
+            max_age: Maximum age for the identity
+            gender: Specific gender ('male', 'female', or None for random)
+        
+        Returns:
+            Generated Identity object
+        """
+        return self._build(
+            date.today(),
+            include_financial=False,
+            include_professional=False,
+            min_age=min_age,
+            max_age=max_age,
+            gender=gender,
+            minimal=True
+        )
+    
+    def _build(
+        self,
+        today: date,
+        include_financial: bool = True,
+        include_professional: bool = True,
+        min_age: int = 18,
+        max_age: int = 65,
+        gender: Optional[str] = None,
+        *,
+        minimal: bool = False
+    ) -> Identity:
+        """Build an identity, computing its age relative to today."""
+        # Local aliases avoid repeated attribute lookups
+        faker = self.faker
+        choice = random.choice
+        randint = random.randint
+        
         # Determine gender
         if gender is None:
-            gender = random.choice(["male", "female"])
+            gender = choice(["male", "female"])
         
         # Generate name based on gender
         if gender == "male":
-            first_name = self.faker.first_name_male()
+            first_name = faker.first_name_male()
         else:
-            first_name = self.faker.first_name_female()
+            first_name = faker.first_name_female()
         
-        last_name = self.faker.last_name()
+        last_name = faker.last_name()
         full_name = f"{first_name} {last_name}"
         
         # Generate birthdate and calculate age
-        birthdate = self.faker.date_of_birth(minimum_age=min_age, maximum_age=max_age)
-        age = self._calculate_age(birthdate)
+        birthdate = faker.date_of_birth(minimum_age=min_age, maximum_age=max_age)
+        age = self._calculate_age(birthdate, today)
         
         # Generate username variations
         username = self._generate_username(first_name, last_name, birthdate.year)
@@ -141,15 +237,20 @@ class IdentityGenerator:
         email = self._generate_email(first_name, last_name)
         
         # Generate address components
-        address = self.faker.street_address()
-        city = self.faker.city()
-        country = self.faker.country()
-        postal_code = self.faker.postcode()
+        address = faker.street_address()
+        city = faker.city()
+        country = faker.country()
+        postal_code = faker.postcode()
         
         # Generate IDs
-        national_id = self.faker.ssn()
-        passport_number = self._generate_passport_number()
-        driver_license = self._generate_driver_license()
+        national_id = None
+        passport_number = None
+        driver_license = None
+        
+        if not minimal:
+            national_id = faker.ssn()
+            passport_number = self._generate_passport_number()
+            driver_license = self._generate_driver_license()
         
         # Financial info
         credit_card = None
@@ -158,9 +259,9 @@ class IdentityGenerator:
         bank_account = None
         
         if include_financial:
-            credit_card = self.faker.credit_card_number()
-            credit_card_expiry = self.faker.credit_card_expire()
-            credit_card_cvv = str(random.randint(100, 999))
+            credit_card = faker.credit_card_number()
+            credit_card_expiry = faker.credit_card_expire()
+            credit_card_cvv = str(randint(100, 999))
             bank_account = self._generate_bank_account()
         
         # Professional info
@@ -169,17 +270,20 @@ class IdentityGenerator:
         website = None
         
         if include_professional:
-            company = self.faker.company()
-            job_title = self.faker.job()
-            website = f"https://{self.faker.domain_name()}"
+            company = faker.company()
+            job_title = faker.job()
+            website = f"https://{faker.domain_name()}"
         
         # Profile picture
-        seed = random.randint(100000, 999999)
-        avatar_template = random.choice(AVATAR_SERVICES)
-        profile_pic_url = avatar_template.format(
-            seed=seed,
-            name=full_name.replace(" ", "+")
-        )
+        profile_pic_url = None
+        
+        if not minimal:
+            seed = randint(100000, 999999)
+            avatar_template = choice(AVATAR_SERVICES)
+            profile_pic_url = avatar_template.format(
+                seed=seed,
+                name=full_name.replace(" ", "+")
+            )
         
         return Identity(
             full_name=full_name,
@@ -187,7 +291,7 @@ class IdentityGenerator:
             last_name=last_name,
             username=username,
             email=email,
-            phone=self.faker.phone_number(),
+            phone=faker.phone_number(),
             address=address,
             city=city,
             country=country,
@@ -212,23 +316,42 @@ class IdentityGenerator:
     def generate_batch(
         self,
         count: int,
-        **kwargs
+        include_financial: bool = True,
+        include_professional: bool = True,
+        min_age: int = 18,
+        max_age: int = 65,
+        gender: Optional[str] = None
     ) -> List[Identity]:
         """
         Generate multiple identities.
         
         Args:
             count: Number of identities to generate
-            **kwargs: Arguments passed to generate()
+            include_financial: Include credit card and bank info
+            include_professional: Include job and company info
+            min_age: Minimum age for the identities
+            max_age: Maximum age for the identities
+            gender: Specific gender ('male', 'female', or None for random)
         
         Returns:
             List of Identity objects
         """
-        return [self.generate(**kwargs) for _ in range(count)]
-    
-    def _calculate_age(self, birthdate: date) -> int:
-        """Calculate age from birthdate."""
+        # Read the date once per batch rather than once per identity
         today = date.today()
+        return [
+            self._build(
+                today,
+                include_financial=include_financial,
+                include_professional=include_professional,
+                min_age=min_age,
+                max_age=max_age,
+                gender=gender
+            )
+            for _ in range(count)
+        ]
+    
+    def _calculate_age(self, birthdate: date, today: date) -> int:
+        """Calculate age from birthdate as of today."""
         age = today.year - birthdate.year
         if (today.month, today.day) < (birthdate.month, birthdate.day):
             age -= 1
@@ -241,32 +364,39 @@ class IdentityGenerator:
         birth_year: int
     ) -> str:
         """Generate a realistic username."""
-        patterns = [
-            f"{first_name.lower()}{last_name.lower()}",
-            f"{first_name.lower()}.{last_name.lower()}",
-            f"{first_name.lower()}_{last_name.lower()}",
-            f"{first_name.lower()}{random.randint(1, 999)}",
-            f"{first_name[0].lower()}{last_name.lower()}{str(birth_year)[-2:]}",
-            f"{last_name.lower()}{first_name[0].lower()}{random.randint(1, 99)}",
-        ]
-        return random.choice(patterns)
+        first = first_name.lower()
+        last = last_name.lower()
+        
+        # Pick the pattern first so only the chosen one is formatted
+        pattern = random.randrange(6)
+        if pattern == 0:
+            return f"{first}{last}"
+        elif pattern == 1:
+            return f"{first}.{last}"
+        elif pattern == 2:
+            return f"{first}_{last}"
+        elif pattern == 3:
+            return f"{first}{random.randint(1, 999)}"
+        elif pattern == 4:
+            return f"{first_name[0].lower()}{last}{str(birth_year)[-2:]}"
+        return f"{last}{first_name[0].lower()}{random.randint(1, 99)}"
     
     def _generate_email(self, first_name: str, last_name: str) -> str:
         """Generate a realistic email address."""
-        domains = [
-            "gmail.com", "yahoo.com", "outlook.com", "hotmail.com",
-            "protonmail.com", "icloud.com", "mail.com", "aol.com"
-        ]
+        first = first_name.lower()
+        last = last_name.lower()
         
-        patterns = [
-            f"{first_name.lower()}.{last_name.lower()}",
-            f"{first_name.lower()}{last_name.lower()}",
-            f"{first_name[0].lower()}{last_name.lower()}",
-            f"{first_name.lower()}{random.randint(1, 999)}",
-        ]
+        pattern = random.randrange(4)
+        if pattern == 0:
+            local_part = f"{first}.{last}"
+        elif pattern == 1:
+            local_part = f"{first}{last}"
+        elif pattern == 2:
+            local_part = f"{first_name[0].lower()}{last}"
+        else:
+            local_part = f"{first}{random.randint(1, 999)}"
         
-        local_part = random.choice(patterns)
-        domain = random.choice(domains)
+        domain = random.choice(EMAIL_DOMAINS)
         return f"{local_part}@{domain}"
     
     def _generate_passport_number(self) -> str:
@@ -286,21 +416,29 @@ class IdentityGenerator:
         return ''.join(random.choices(string.digits, k=16))
 
 
-def generate_fake_identity(locale: str = "en_US") -> Dict[str, Any]:
+def generate_fake_identity(locale: str = "en_US", minimal: bool = False) -> Dict[str, Any]:
     """
     Generate a single fake identity (backward compatible function).
     
     Args:
         locale: Locale for generating localized data
+        minimal: Only generate personal and contact details
+            (see IdentityGenerator.generate_minimal)
     
     Returns:
         Dictionary containing identity information
     """
-    generator = IdentityGenerator(locale=locale)
-    identity = generator.generate()
+    generator = _get_default_generator(locale)
+    identity = generator.generate_minimal() if minimal else generator.generate()
     return identity.to_dict()
 
 
+@functools.lru_cache(maxsize=32)
+def _get_default_generator(locale: str) -> IdentityGenerator:
+    """Return the generator reused by generate_fake_identity() for the locale."""
+    return IdentityGenerator(locale=locale)
+
+
 if __name__ == "__main__":
     # Demo
     generator = IdentityGenerator(locale="en_US")
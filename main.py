@@ -2,23 +2,65 @@ from identity_generator import generate_fake_identity
 from fingerprint_generator import generate_fingerprint
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def dump_profile(profile):
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(profile)
+    return json.dumps(profile, separators=(",", ":")).encode()
 
 def save_profile_to_file(profile, filename):
-    with open(filename, "w") as f:
-        json.dump(profile, f, indent=4)
-    print(f"[✔] File saved: {filename}")
+    with open(filename, "wb") as f:
+        f.write(dump_profile(profile))
+
+def generate_profile():
+    identity = generate_fake_identity()
+    fingerprint = generate_fingerprint()
+    return {
+        "identity": identity,
+        "fingerprint": fingerprint
+    }
+
+def generate_and_save_profile(i):
+    filename = f"profiles/fake_profile_{i}.json"
+    save_profile_to_file(generate_profile(), filename)
+    return filename
 
-def generate_multiple_profiles(count=5):
+def save_profiles_to_jsonl(count, filename):
+    buffer = bytearray()
+    for _ in range(count):
+        buffer += dump_profile(generate_profile())
+        buffer += b"\n"
+    with open(filename, "wb") as f:
+        f.write(buffer)
+    return filename
+
+def save_profiles_to_files(count, on_progress=None):
     os.makedirs("profiles", exist_ok=True)
-    for i in range(1, count + 1):
-        identity = generate_fake_identity()
-        fingerprint = generate_fingerprint()
-        profile = {
-            "identity": identity,
-            "fingerprint": fingerprint
-        }
-        filename = f"profiles/fake_profile_{i}.json"
-        save_profile_to_file(profile, filename)
+    with ThreadPoolExecutor() as executor:
+        results = executor.map(generate_and_save_profile, range(1, count + 1))
+        for done, filename in enumerate(results, start=1):
+            if on_progress:
+                on_progress(done, filename)
+
+def print_saved(done, filename):
+    print(f"[✔] File saved: {filename}")
+
+def generate_multiple_profiles(count=5, mode="files"):
+    if mode == "jsonl":
+        os.makedirs("profiles", exist_ok=True)
+        filename = save_profiles_to_jsonl(count, "profiles/profiles.jsonl")
+        print_saved(count, filename)
+    elif mode == "files":
+        save_profiles_to_files(count, on_progress=print_saved)
+    else:
+        raise ValueError(f"Unknown mode: {mode!r} (expected 'files' or 'jsonl')")
 
 if __name__ == "__main__":
     number = int(input("Enter number of profiles to generate: "))